@@ -105,6 +105,27 @@ def get_volume_slug(volume_num):
     }
     return slugs.get(volume_num, 'unknown')
 
+def get_article_class(canonical_text):
+    """Determine article class from canonical text word count"""
+    if not canonical_text or canonical_text == "[CANONICAL TEXT TO BE GENERATED]":
+        # Placeholder entries are treated as major (will span)
+        return 'major'
+    
+    # Rough word count estimate (split on whitespace)
+    word_count = len(canonical_text.split())
+    
+    # Article class detection (by word count):
+    # Class I (Constellation): 800-1200 words → spanning title, fresh page
+    # Class II (Major): 450-600 words → spanning title, may share page
+    # Class III (Minor): 220-300 words → run-in headword, shares page
+    # Class IV/V: handled as marginalia only
+    # Very short entries are treated as minor
+    if word_count >= 800:
+        return 'constellation'  # Class I
+    elif word_count >= 450:
+        return 'major'  # Class II
+    return 'minor'  # Class III
+
 def parse_entry(entry_content):
     """Parse an entry AsciiDoc block and extract title, canonical text, author, and marginalia"""
     # Extract entry title (=== Title) - can be anywhere in file
@@ -410,33 +431,8 @@ def convert_asciidoc_to_latex(adoc_file, output_file, volume_num, edition, year=
         # Determine article class based on word count
         # Article class determines layout, not the other way around
         canonical_text = entry.get('canonical', '')
-        if canonical_text and canonical_text != "[CANONICAL TEXT TO BE GENERATED]":
-            # Rough word count estimate (split on whitespace)
-            word_count = len(canonical_text.split())
-            
-            # Article class detection (by word count):
-            # Class I (Constellation): 800-1200 words → spanning title, fresh page
-            # Class II (Major): 450-600 words → spanning title, may share page
-            # Class III (Minor): 220-300 words → run-in headword, shares page
-            # Class IV/V: handled as marginalia only
-            
-            if word_count >= 800:
-                article_class = 'constellation'  # Class I
-                use_spanning = True
-            elif word_count >= 450:
-                article_class = 'major'  # Class II
-                use_spanning = True
-            elif word_count >= 220:
-                article_class = 'minor'  # Class III
-                use_spanning = False
-            else:
-                # Very short entries treated as minor
-                article_class = 'minor'
-                use_spanning = False
-        else:
-            # Placeholder entries are treated as major (will span)
-            article_class = 'major'
-            use_spanning = True
+        article_class = get_article_class(canonical_text)
+        use_spanning = article_class != 'minor'
         
         # Apply layout based on article class
         if use_spanning:
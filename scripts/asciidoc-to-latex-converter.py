@@ -4,9 +4,11 @@ AsciiDoc to LaTeX Converter for The Encyclopædia
 Properly handles canonical text and marginalia blocks
 """
 
+import os
 import re
 import sys
 import subprocess
+import tempfile
 from pathlib import Path
 
 def parse_marginalia_block(content):
@@ -22,31 +24,79 @@ def parse_marginalia_block(content):
     
     return attrs
 
+# Marginalia quote blocks as emitted by asciidoctor's LaTeX backend:
+# \begin{quote}[role=marginalia, ...] ... \end{quote}
+MARGINALIA_OPEN = re.compile(r'\\begin\{quote\}\[role=marginalia')
+QUOTE_TOKEN = re.compile(r'\\(begin|end)\{quote\}(\[role=marginalia)?')
+
+# A marginalia block longer than this many lines is treated as a stray opener
+# and passed through verbatim, bounding how much of the input is buffered at once
+MAX_MARGINALIA_LINES = 200
+
+AUTHOR_ATTR = re.compile(r'author=["\']([^"\']+)["\']')
+TYPE_ATTR = re.compile(r'type=([^,\]]+)')
+YEAR_ATTR = re.compile(r'year=["\']([^"\']+)["\']')
+WHITESPACE = re.compile(r'\s+')
+
+# Post-processor states
+OUTSIDE, ATTRS, BODY = range(3)
+
+def open_stream(path, mode):
+    """Open a file for streaming, treating '-' as stdin/stdout"""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        stream.reconfigure(encoding='utf-8')
+        return stream
+    return open(path, mode, encoding='utf-8')
+
+def write_output(output_file, chunks):
+    """Write chunks to output_file ('-' for stdout), replacing a file only once complete"""
+    if output_file == '-':
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stdout.writelines(chunks)
+        sys.stdout.flush()
+        return
+    
+    # Stream into a temporary file alongside the output so a failure
+    # part-way through never leaves a truncated .tex behind
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        # mkstemp creates the file 0600; give it the usual umask permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def convert_asciidoc_to_latex(adoc_file, output_file, volume_num, edition, year="2026"):
     """Convert AsciiDoc file to LaTeX with proper marginalia handling"""
     
     # Check if input is already LaTeX (from asciidoctor) or AsciiDoc
-    is_latex = adoc_file.endswith('.tex') or adoc_file.endswith('.raw')
+    # stdin is always asciidoctor LaTeX output being piped through
+    is_latex = adoc_file == '-' or adoc_file.endswith('.tex') or adoc_file.endswith('.raw')
     
-    if is_latex:
-        # Post-process LaTeX file
-        with open(adoc_file, 'r', encoding='utf-8') as f:
-            latex_content = f.read()
-    else:
-        # Convert AsciiDoc to LaTeX first
-        with open(adoc_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    infile = open_stream(adoc_file, 'r')
+    try:
+        if is_latex:
+            # Post-process LaTeX file line by line
+            lines = infile
+        else:
+            # Convert AsciiDoc to LaTeX first
+            # Use asciidoctor via subprocess to convert
+            # For now, we'll do a simple conversion
+            latex_content = convert_asciidoc_direct(infile.read(), adoc_file)
+            lines = latex_content.splitlines(keepends=True)
         
-        # Use asciidoctor via subprocess to convert
-        # For now, we'll do a simple conversion
-        latex_content = convert_asciidoc_direct(content, adoc_file)
-    
-    # Post-process LaTeX to handle marginalia
-    latex_content = postprocess_latex_marginalia(latex_content)
-    
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(latex_content)
+        # Post-process LaTeX to handle marginalia, writing output incrementally
+        write_output(output_file, iter_postprocess_latex_marginalia(lines))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
 
 def convert_asciidoc_direct(content, source_file):
     """Direct AsciiDoc to LaTeX conversion (simplified)"""
@@ -54,69 +104,158 @@ def convert_asciidoc_direct(content, source_file):
     # For now, return basic structure
     return content
 
-def postprocess_latex_marginalia(latex_content):
-    r"""Post-process LaTeX to convert marginalia blocks to \marginalia commands"""
+def format_marginalia(attrs_str, content):
+    r"""Render a marginalia block's attributes and body as a \marginalia command"""
+    # Parse attributes
+    author = 'Unknown'
+    note_type = 'note'
+    year = ''
     
-    # Pattern 1: Quote blocks with role=marginalia attributes
-    # \begin{quote}[role=marginalia, ...] ... \end{quote}
-    def replace_marginalia_quote(match):
-        attrs_str = match.group(1) if match.group(1) else ''
-        content = match.group(2)
-        
-        # Parse attributes
-        author = 'Unknown'
-        note_type = 'note'
-        year = ''
-        
-        # Extract author
-        author_match = re.search(r'author=["\']([^"\']+)["\']', attrs_str)
-        if author_match:
-            author = author_match.group(1)
-        
-        # Extract type
-        type_match = re.search(r'type=([^,\]]+)', attrs_str)
-        if type_match:
-            note_type = type_match.group(1).strip(' "\'')
-        
-        # Extract year
-        year_match = re.search(r'year=["\']([^"\']+)["\']', attrs_str)
-        if year_match:
-            year = year_match.group(1)
-        
-        # Format note type
-        if year:
-            note_type_full = f"{note_type} ({year})"
-        else:
-            note_type_full = note_type
-        
-        # Clean content - remove LaTeX commands that might interfere
-        content = content.strip()
-        content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-        content = content.replace('\\', '\\textbackslash{}')
-        
-        return f"\\marginalia{{{author}}}{{{note_type_full}}}{{{content}}}"
+    # Extract author
+    author_match = AUTHOR_ATTR.search(attrs_str)
+    if author_match:
+        author = author_match.group(1)
+    
+    # Extract type
+    type_match = TYPE_ATTR.search(attrs_str)
+    if type_match:
+        note_type = type_match.group(1).strip(' "\'')
+    
+    # Extract year
+    year_match = YEAR_ATTR.search(attrs_str)
+    if year_match:
+        year = year_match.group(1)
+    
+    # Format note type
+    if year:
+        note_type_full = f"{note_type} ({year})"
+    else:
+        note_type_full = note_type
     
-    # Match quote blocks with role=marginalia
-    pattern = r'\\begin\{quote\}\[role=marginalia([^\]]*)\](.*?)\\end\{quote\}'
-    latex_content = re.sub(pattern, replace_marginalia_quote, latex_content, flags=re.DOTALL)
+    # Clean content - remove LaTeX commands that might interfere
+    content = content.strip()
+    content = WHITESPACE.sub(' ', content)  # Normalize whitespace
+    content = content.replace('\\', '\\textbackslash{}')
     
-    return latex_content
+    return f"\\marginalia{{{author}}}{{{note_type_full}}}{{{content}}}"
+
+def unterminated_marginalia(state, attrs, body):
+    """Source text of a marginalia block that was opened but never closed"""
+    text = '\\begin{quote}[role=marginalia' + ''.join(attrs)
+    if state == BODY:
+        text += ']' + ''.join(body)
+    return text
+
+def warn_unconverted(start_line, reason):
+    """Report a marginalia block that is being passed through unconverted"""
+    print(f"⚠️  Marginalia block opened on line {start_line} {reason}; left unconverted", file=sys.stderr)
+
+def iter_postprocess_latex_marginalia(lines):
+    r"""Stream LaTeX lines, yielding output with marginalia blocks converted to \marginalia commands
     
-    # Post-process LaTeX content
-    processed_latex = postprocess_latex_marginalia(latex_content)
+    Runs a small state machine over the input so only the marginalia block
+    currently being read is held in memory. Nested quote environments inside
+    a marginalia block are tracked by depth, so the block ends at its own
+    \end{quote} rather than the first one. Marginalia never nest, so a new
+    marginalia opener inside an open block means the pending one was stray:
+    it is passed through unchanged and processing resumes at the new opener.
+    Blocks running past MAX_MARGINALIA_LINES are passed through the same way.
+    Each block left unconverted is reported on stderr with its line number.
+    The bound counts lines, not bytes: a single very long line is still
+    buffered in full.
+    """
+    state = OUTSIDE
+    attrs = []
+    body = []
+    depth = 0
+    block_lines = 0
+    start_line = 0
     
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(processed_latex)
+    for line_number, line in enumerate(lines, start=1):
+        if state != OUTSIDE:
+            block_lines += 1
+            if block_lines > MAX_MARGINALIA_LINES:
+                warn_unconverted(start_line, f"is not closed within {MAX_MARGINALIA_LINES} lines")
+                yield unterminated_marginalia(state, attrs, body)
+                state = OUTSIDE
+        
+        pos = 0
+        while pos < len(line):
+            if state == OUTSIDE:
+                match = MARGINALIA_OPEN.search(line, pos)
+                if not match:
+                    yield line[pos:]
+                    break
+                if match.start() > pos:
+                    yield line[pos:match.start()]
+                state = ATTRS
+                attrs = []
+                body = []
+                block_lines = 0
+                start_line = line_number
+                pos = match.end()
+            elif state == ATTRS:
+                end = line.find(']', pos)
+                match = MARGINALIA_OPEN.search(line, pos)
+                if match and (end < 0 or match.start() < end):
+                    # Stray opener: flush it and resync on the new one
+                    attrs.append(line[pos:match.start()])
+                    warn_unconverted(start_line, f"is interrupted by another on line {line_number}")
+                    yield unterminated_marginalia(state, attrs, body)
+                    state = OUTSIDE
+                    pos = match.start()
+                elif end < 0:
+                    attrs.append(line[pos:])
+                    break
+                else:
+                    attrs.append(line[pos:end])
+                    state = BODY
+                    depth = 1
+                    pos = end + 1
+            else:
+                match = QUOTE_TOKEN.search(line, pos)
+                if not match:
+                    body.append(line[pos:])
+                    break
+                if match.group(2):
+                    # Stray opener: flush it and resync on the new one
+                    body.append(line[pos:match.start()])
+                    warn_unconverted(start_line, f"is interrupted by another on line {line_number}")
+                    yield unterminated_marginalia(state, attrs, body)
+                    state = OUTSIDE
+                    pos = match.start()
+                    continue
+                depth += 1 if match.group(1) == 'begin' else -1
+                if depth == 0:
+                    body.append(line[pos:match.start()])
+                    yield format_marginalia(''.join(attrs), ''.join(body))
+                    state = OUTSIDE
+                else:
+                    body.append(line[pos:match.end()])
+                pos = match.end()
     
-    print(f"✅ Processed {adoc_file} → {output_file}")
+    # Replay an unterminated block verbatim
+    if state != OUTSIDE:
+        warn_unconverted(start_line, "is never closed")
+        yield unterminated_marginalia(state, attrs, body)
+
+def postprocess_latex_marginalia(latex_content):
+    r"""Post-process LaTeX to convert marginalia blocks to \marginalia commands"""
+    lines = latex_content.splitlines(keepends=True)
+    return ''.join(iter_postprocess_latex_marginalia(lines))
 
 if __name__ == '__main__':
     if len(sys.argv) < 3:
-        print("Usage: python3 asciidoc-to-latex-converter.py <input.adoc> <output.tex>")
+        print("Usage: python3 asciidoc-to-latex-converter.py <input.adoc|input.tex|-> <output.tex|->", file=sys.stderr)
         sys.exit(1)
     
     input_file = sys.argv[1]
     output_file = sys.argv[2]
     
-    convert_asciidoc_to_latex(input_file, output_file, "01", "adult")
+    try:
+        convert_asciidoc_to_latex(input_file, output_file, "01", "adult")
+    except BrokenPipeError:
+        # Reader closed the pipe early (e.g. `| head`); exit quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
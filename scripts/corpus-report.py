@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Corpus Statistics and Editorial Reports for The Encyclopædia
+Loads per-entry metrics from both editions into columns once, then aggregates them
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Reuse the converter's parser so reports see entries exactly as the PDF build does
+_spec = importlib.util.spec_from_file_location(
+    'asciidoc_to_latex_converter_v3', SCRIPT_DIR / 'asciidoc-to-latex-converter-v3.py'
+)
+converter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(converter)
+
+PLACEHOLDER = "[CANONICAL TEXT TO BE GENERATED]"
+MARGINALIA_PLACEHOLDER = "[MARGINALIA TO BE GENERATED]"
+
+# Unwritten entries get this in place of an article class and target status
+PENDING = 'pending'
+
+# Marginalia density is measured against the converter's placement rule (~1 per 275 words)
+MARGINALIA_WORDS = 275
+
+ARTICLE_CLASSES = ('constellation', 'major', 'minor')
+
+VOLUME_DIR_PATTERN = re.compile(r'^volume-(\d+)-(.+)$')
+ENTRY_TYPE_PATTERN = re.compile(r'^:entry-type:\s*(.+)$', re.MULTILINE)
+WORD_TARGET_PATTERN = re.compile(r'^:word-target:\s*(\d+)\s*[–-]\s*(\d+)', re.MULTILINE)
+COMMENT_LINE_PATTERN = re.compile(r'^//.*(?:\n|$)', re.MULTILINE)
+
+# Per-entry columns, in output order
+ENTRY_COLUMNS = (
+    'edition', 'volume', 'volume_slug', 'entry', 'title', 'faculty_id', 'entry_type',
+    'article_class', 'words', 'word_target_min', 'word_target_max', 'target_status',
+    'marginalia',
+)
+
+def strip_comments(canonical_text):
+    """Canonical text without AsciiDoc // comment lines"""
+    return COMMENT_LINE_PATTERN.sub('', canonical_text).strip()
+
+def is_placeholder(canonical_text):
+    """True if an entry has no written canonical text yet
+
+    Entries whose text still opens with the placeholder are unwritten, even
+    if editorial notes follow it.
+    """
+    text = strip_comments(canonical_text)
+    return not text or text.startswith(PLACEHOLDER)
+
+def get_target_status(pending, words, target_min, target_max):
+    """Where an entry's word count falls against its :word-target: range"""
+    if pending:
+        return PENDING
+    if target_min is None:
+        return 'none'
+    if words < target_min:
+        return 'under'
+    if words > target_max:
+        return 'over'
+    return 'within'
+
+def load_corpus(root):
+    """Parse every entry in both editions into a dict of parallel column lists"""
+    columns = {name: [] for name in ENTRY_COLUMNS}
+
+    for entry_file in sorted(Path(root).glob('editions/*/volumes/volume-*/entries/*.adoc')):
+        volume_dir = entry_file.parent.parent
+        volume_match = VOLUME_DIR_PATTERN.match(volume_dir.name)
+        if not volume_match:
+            continue
+
+        with open(entry_file, 'r', encoding='utf-8') as f:
+            entry_content = f.read()
+        parsed = converter.parse_entry(entry_content)
+
+        canonical = strip_comments(parsed['canonical'])
+        pending = is_placeholder(canonical)
+        words = 0 if pending else len(canonical.split())
+        marginalia = sum(1 for m in parsed['marginalia'] if m['content'] != MARGINALIA_PLACEHOLDER)
+
+        entry_type = ENTRY_TYPE_PATTERN.search(entry_content)
+        target = WORD_TARGET_PATTERN.search(entry_content)
+        target_min = int(target.group(1)) if target else None
+        target_max = int(target.group(2)) if target else None
+
+        target_status = get_target_status(pending, words, target_min, target_max)
+
+        columns['edition'].append(volume_dir.parent.parent.name)
+        columns['volume'].append(volume_match.group(1))
+        columns['volume_slug'].append(volume_match.group(2))
+        columns['entry'].append(entry_file.stem)
+        columns['title'].append(parsed['title'])
+        columns['faculty_id'].append(parsed['author'] or '')
+        columns['entry_type'].append(entry_type.group(1).strip() if entry_type else '')
+        columns['article_class'].append(PENDING if pending else converter.get_article_class(canonical))
+        columns['words'].append(words)
+        columns['word_target_min'].append(target_min)
+        columns['word_target_max'].append(target_max)
+        columns['target_status'].append(target_status)
+        columns['marginalia'].append(marginalia)
+
+    return columns
+
+def group_rows(columns, keys):
+    """Map each distinct key tuple to the row indices that share it"""
+    groups = defaultdict(list)
+    for i, key in enumerate(zip(*(columns[k] for k in keys))):
+        groups[key].append(i)
+    return groups
+
+def marginalia_density(marginalia, words):
+    """Marginalia per 275 words of canonical text"""
+    return round(marginalia * MARGINALIA_WORDS / words, 3) if words else 0.0
+
+def written_rows(columns, idx):
+    """Row indices in idx whose entries have canonical text"""
+    article_class = columns['article_class']
+    return [i for i in idx if article_class[i] != PENDING]
+
+def report_entries(columns):
+    """One row per entry"""
+    return [dict(zip(ENTRY_COLUMNS, row)) for row in zip(*(columns[k] for k in ENTRY_COLUMNS))]
+
+def report_volumes(columns):
+    """Word counts, article classes, target coverage and marginalia density per volume
+
+    Word, class, target and marginalia figures cover written entries only;
+    unwritten entries are counted in the pending column.
+    """
+    words = columns['words']
+    marginalia = columns['marginalia']
+    article_class = columns['article_class']
+    target_status = columns['target_status']
+
+    rows = []
+    for (edition, volume, slug), idx in sorted(group_rows(columns, ('edition', 'volume', 'volume_slug')).items()):
+        written = written_rows(columns, idx)
+        classes = Counter(article_class[i] for i in idx)
+        statuses = Counter(target_status[i] for i in idx)
+        total_words = sum(words[i] for i in written)
+        total_marginalia = sum(marginalia[i] for i in written)
+        row = {
+            'edition': edition,
+            'volume': volume,
+            'volume_slug': slug,
+            'entries': len(idx),
+            'written': len(written),
+            PENDING: classes[PENDING],
+            'words': total_words,
+            'mean_words': round(total_words / len(written)) if written else 0,
+        }
+        for name in ARTICLE_CLASSES:
+            row[name] = classes[name]
+        for status in ('under', 'within', 'over', 'none'):
+            row[f'target_{status}'] = statuses[status]
+        row['marginalia'] = total_marginalia
+        row['marginalia_per_275'] = marginalia_density(total_marginalia, total_words)
+        rows.append(row)
+    return rows
+
+def report_faculty(columns):
+    """Entry coverage per faculty ID across editions and volumes"""
+    edition = columns['edition']
+    volume = columns['volume']
+    words = columns['words']
+    marginalia = columns['marginalia']
+
+    rows = []
+    for (faculty_id,), idx in sorted(group_rows(columns, ('faculty_id',)).items()):
+        written = written_rows(columns, idx)
+        editions = Counter(edition[i] for i in idx)
+        total_words = sum(words[i] for i in written)
+        rows.append({
+            'faculty_id': faculty_id,
+            'entries': len(idx),
+            'written': len(written),
+            'adult': editions['adult'],
+            'children': editions['children'],
+            'volumes': len({volume[i] for i in idx}),
+            'words': total_words,
+            'marginalia_per_275': marginalia_density(sum(marginalia[i] for i in written), total_words),
+        })
+    return rows
+
+REPORTS = {
+    'entries': report_entries,
+    'volumes': report_volumes,
+    'faculty': report_faculty,
+}
+
+def write_csv(rows, out):
+    if not rows:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]), lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows)
+
+def write_json(rows, out):
+    json.dump(rows, out, ensure_ascii=False, indent=2)
+    out.write('\n')
+
+def write_markdown(rows, out):
+    if not rows:
+        return
+    fields = list(rows[0])
+    out.write('| ' + ' | '.join(fields) + ' |\n')
+    out.write('|' + '|'.join('---' for _ in fields) + '|\n')
+    for row in rows:
+        cells = ('' if row[f] is None else str(row[f]).replace('|', '\\|') for f in fields)
+        out.write('| ' + ' | '.join(cells) + ' |\n')
+
+WRITERS = {
+    'csv': write_csv,
+    'json': write_json,
+    'markdown': write_markdown,
+}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Corpus-wide statistics for both editions')
+    parser.add_argument('report', nargs='?', default='volumes', choices=sorted(REPORTS))
+    parser.add_argument('--format', default='markdown', choices=sorted(WRITERS))
+    parser.add_argument('--output', default='-', help="output file ('-' for stdout)")
+    parser.add_argument('--root', default=str(SCRIPT_DIR.parent), help='repository root')
+    args = parser.parse_args()
+
+    rows = REPORTS[args.report](load_corpus(args.root))
+
+    if args.output == '-':
+        try:
+            WRITERS[args.format](rows, sys.stdout)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # Reader closed the pipe early (e.g. `| head`); exit quietly
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(1)
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            WRITERS[args.format](rows, f)
+        print(f"✅ Wrote {len(rows)} {args.report} rows to {args.output}", file=sys.stderr)
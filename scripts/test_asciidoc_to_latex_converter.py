@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the marginalia post-processor in asciidoc-to-latex-converter.py
+Run with: python3 -m unittest scripts/test_asciidoc_to_latex_converter.py
+"""
+
+import contextlib
+import importlib.util
+import io
+import unittest
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    'asciidoc_to_latex_converter', Path(__file__).resolve().parent / 'asciidoc-to-latex-converter.py'
+)
+converter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(converter)
+
+VALID_BLOCK = '\\begin{quote}[role=marginalia, author="A. B", type=gloss]\nnote %s\n\\end{quote}\n'
+
+class PostprocessMarginaliaTest(unittest.TestCase):
+    def postprocess(self, latex):
+        """Run the post-processor, returning its output and stderr warnings"""
+        warnings = io.StringIO()
+        with contextlib.redirect_stderr(warnings):
+            result = converter.postprocess_latex_marginalia(latex)
+        return result, warnings.getvalue()
+
+    def test_converts_block(self):
+        result = converter.postprocess_latex_marginalia('before\n' + VALID_BLOCK % 1 + 'after\n')
+        self.assertEqual(result, 'before\n\\marginalia{A. B}{gloss}{note 1}\nafter\n')
+
+    def test_nested_quote_stays_inside_block(self):
+        latex = (
+            '\\begin{quote}[role=marginalia, author="X"]\nouter\n'
+            '\\begin{quote}\ninner\n\\end{quote}\ntail\n\\end{quote}\nb\n'
+        )
+        result = converter.postprocess_latex_marginalia(latex)
+        self.assertEqual(
+            result,
+            '\\marginalia{X}{note}{outer \\textbackslash{}begin{quote} inner '
+            '\\textbackslash{}end{quote} tail}\nb\n'
+        )
+
+    def test_stray_opener_resyncs_on_next_block(self):
+        stray = '\\begin{quote}[role=marginalia, author="S"]\nstray text\n'
+        result, warnings = self.postprocess('x\n' + stray + VALID_BLOCK % 1 + VALID_BLOCK % 2)
+        self.assertEqual(
+            result,
+            'x\n' + stray + '\\marginalia{A. B}{gloss}{note 1}\n\\marginalia{A. B}{gloss}{note 2}\n'
+        )
+        self.assertIn('opened on line 2 is interrupted by another on line 4', warnings)
+
+    def test_unterminated_block_is_bounded(self):
+        stray = '\\begin{quote}[role=marginalia, author="S"]\n'
+        filler = 'line\n' * (converter.MAX_MARGINALIA_LINES + 5)
+        latex = stray + filler + 'x\\end{quote}\n'
+        result, warnings = self.postprocess(latex)
+        self.assertEqual(result, latex)
+        self.assertIn(f'opened on line 1 is not closed within {converter.MAX_MARGINALIA_LINES} lines', warnings)
+
+    def test_valid_blocks_do_not_warn(self):
+        result, warnings = self.postprocess(VALID_BLOCK % 1)
+        self.assertEqual(warnings, '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for asciidoc-to-latex-converter-v3.py against real volume files
+Run with: python3 -m unittest scripts/test_asciidoc_to_latex_converter_v3.py
+"""
+
+import contextlib
+import importlib.util
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+_spec = importlib.util.spec_from_file_location(
+    'asciidoc_to_latex_converter_v3', SCRIPT_DIR / 'asciidoc-to-latex-converter-v3.py'
+)
+converter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(converter)
+
+class ConvertVolumeTest(unittest.TestCase):
+    def convert(self, edition):
+        volume = REPO_ROOT / 'editions' / edition / 'volumes' / 'volume-01-mind' / 'volume.adoc'
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / f'{edition}-volume-01.tex'
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                converter.convert_asciidoc_to_latex(str(volume), str(output), '01', edition)
+            return output.read_text(encoding='utf-8')
+
+    def test_converts_adult_volume(self):
+        latex = self.convert('adult')
+        self.assertTrue(latex.startswith('\\documentclass{encyclopaedia}'))
+        self.assertIn('\\entry{', latex)
+        self.assertIn('\\marginalia{', latex)
+        self.assertTrue(latex.endswith('\\end{document}\n'))
+
+    def test_converts_children_volume(self):
+        latex = self.convert('children')
+        self.assertIn('\\entry{', latex)
+        self.assertTrue(latex.endswith('\\end{document}\n'))
+
+class ArticleClassTest(unittest.TestCase):
+    def test_classes_by_word_count(self):
+        self.assertEqual(converter.get_article_class('word ' * 800), 'constellation')
+        self.assertEqual(converter.get_article_class('word ' * 450), 'major')
+        self.assertEqual(converter.get_article_class('word ' * 100), 'minor')
+
+    def test_placeholder_is_laid_out_as_major(self):
+        self.assertEqual(converter.get_article_class('[CANONICAL TEXT TO BE GENERATED]'), 'major')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for corpus-report.py
+Run with: python3 -m unittest scripts/test_corpus_report.py
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    'corpus_report', Path(__file__).resolve().parent / 'corpus-report.py'
+)
+report = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(report)
+
+ENTRY_TEMPLATE = """[[entry-{slug}]]
+=== {title}
+:faculty-id: a.{faculty}
+:entry-type: standard
+{target}
+[role=canonical]
+====
+{canonical}
+====
+
+[role=marginalia,
+ type=gloss,
+ author="Reviewer"]
+====
+{marginalia}
+====
+"""
+
+def write_entry(root, edition, volume, slug, canonical, target=':word-target: 10–20',
+                faculty='smith', marginalia='[MARGINALIA TO BE GENERATED]'):
+    entry_dir = Path(root) / 'editions' / edition / 'volumes' / volume / 'entries'
+    entry_dir.mkdir(parents=True, exist_ok=True)
+    (entry_dir / f'{slug}.adoc').write_text(ENTRY_TEMPLATE.format(
+        slug=slug, title=slug.title(), faculty=faculty, target=target,
+        canonical=canonical, marginalia=marginalia,
+    ), encoding='utf-8')
+
+class IsPlaceholderTest(unittest.TestCase):
+    def test_placeholder_and_empty(self):
+        self.assertTrue(report.is_placeholder(report.PLACEHOLDER))
+        self.assertTrue(report.is_placeholder(''))
+        self.assertTrue(report.is_placeholder('  \n'))
+
+    def test_placeholder_followed_by_comments_or_notes(self):
+        self.assertTrue(report.is_placeholder(report.PLACEHOLDER + '\n\n// outline point\n// another'))
+        self.assertTrue(report.is_placeholder(report.PLACEHOLDER + '\n\nNotes for the writer.'))
+        self.assertTrue(report.is_placeholder('// outline first\n' + report.PLACEHOLDER))
+
+    def test_written_text(self):
+        self.assertFalse(report.is_placeholder('Attention is selection.'))
+
+    def test_strip_comments(self):
+        self.assertEqual(report.strip_comments('one two\n// note\nthree'), 'one two\nthree')
+
+class TargetStatusTest(unittest.TestCase):
+    def test_statuses(self):
+        self.assertEqual(report.get_target_status(False, 5, 10, 20), 'under')
+        self.assertEqual(report.get_target_status(False, 15, 10, 20), 'within')
+        self.assertEqual(report.get_target_status(False, 25, 10, 20), 'over')
+        self.assertEqual(report.get_target_status(False, 15, None, None), 'none')
+        self.assertEqual(report.get_target_status(True, 0, 10, 20), report.PENDING)
+
+class LoadCorpusTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        volume = 'volume-01-mind'
+        write_entry(root, 'adult', volume, 'written', 'word ' * 15 + '\n// editorial note here',
+                    marginalia='A real note.')
+        write_entry(root, 'adult', volume, 'long', 'word ' * 30, target='')
+        write_entry(root, 'adult', volume, 'stub', report.PLACEHOLDER + '\n\n// outline point one two')
+        write_entry(root, 'children', volume, 'written', 'word ' * 5)
+        self.columns = report.load_corpus(root)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def entry(self, edition, slug):
+        rows = report.report_entries(self.columns)
+        return next(r for r in rows if r['edition'] == edition and r['entry'] == slug)
+
+    def test_entry_metrics(self):
+        written = self.entry('adult', 'written')
+        self.assertEqual(written['words'], 15)
+        self.assertEqual(written['target_status'], 'within')
+        self.assertEqual(written['marginalia'], 1)
+        self.assertEqual(self.entry('adult', 'long')['target_status'], 'none')
+        self.assertEqual(self.entry('children', 'written')['target_status'], 'under')
+
+    def test_placeholder_entry_is_pending(self):
+        stub = self.entry('adult', 'stub')
+        self.assertEqual(stub['words'], 0)
+        self.assertEqual(stub['article_class'], report.PENDING)
+        self.assertEqual(stub['target_status'], report.PENDING)
+        self.assertEqual(stub['marginalia'], 0)
+
+    def test_volume_aggregate(self):
+        adult = next(r for r in report.report_volumes(self.columns) if r['edition'] == 'adult')
+        self.assertEqual(adult['entries'], 3)
+        self.assertEqual(adult['written'], 2)
+        self.assertEqual(adult['pending'], 1)
+        self.assertEqual(adult['words'], 45)
+        self.assertEqual(adult['mean_words'], 22)
+        self.assertEqual(adult['minor'], 2)
+        self.assertEqual(adult['major'], 0)
+        self.assertEqual(
+            (adult['target_under'], adult['target_within'], adult['target_over'], adult['target_none']),
+            (0, 1, 0, 1)
+        )
+        self.assertEqual(adult['marginalia'], 1)
+        self.assertEqual(adult['marginalia_per_275'], round(275 / 45, 3))
+
+if __name__ == '__main__':
+    unittest.main()